@@ -1,19 +1,30 @@
-from typing import Any, Optional, ClassVar
+from typing import Any, Mapping, Optional, ClassVar
+from types import MappingProxyType
 import os
-import json
+import asyncio
 import traceback
 
+try:
+    import orjson as json
+except ImportError:
+    import json
+
 import logging
 
 import discord
 from discord.ext import commands
 
-from aiohttp import ClientSession, MultipartWriter
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 
 from .context import MathContext
 
 class MathBot(commands.Bot):
     color: ClassVar[int] = 0x2F3136
+    _EXTENSIONS: ClassVar[tuple[str, ...]] = tuple(
+        'bot.ext.' + ext[:-3]
+        for ext in sorted(os.listdir(os.path.join(os.path.dirname(__file__), 'ext')))
+        if ext.endswith('.py') and ext != '__init__.py'
+    )
 
     def __init__(self, **kwargs):
 
@@ -51,26 +62,20 @@ class MathBot(commands.Bot):
         return
 
     def load_config(self) -> None:
-        with open('config.json') as config:
-            self.config: dict[str, Any] = json.load(config)
+        with open('config.json', 'rb') as config:
+            self.config: Mapping[str, Any] = MappingProxyType(json.loads(config.read()))
 
     def run(self, *args, **kwargs) -> None:
         token: str = kwargs.pop('token', self._token)
         return super().run(token, *args, **kwargs)
 
     async def load_all_cogs(self, *, jishaku: bool = True) -> None:
+        coros = [self.load_extension(ext) for ext in self._EXTENSIONS]
 
         if jishaku:
-            await self.load_extension('jishaku')
-
-        for ext in os.listdir('./bot/ext'):
-            if not ext.endswith(".py"):
-                continue
-
-            if ext == '__init__.py':
-                continue
+            coros.insert(0, self.load_extension('jishaku'))
 
-            await self.load_extension('bot.ext.' + ext[:-3])
+        await asyncio.gather(*coros)
         return None
 
     async def on_connect(self) -> None:
@@ -80,7 +85,16 @@ class MathBot(commands.Bot):
         self._logger.info('bot is ready')
 
     async def start(self, *args, **kwargs) -> None:
-        self.session = ClientSession()
+        self.session = ClientSession(
+            connector=TCPConnector(
+                limit=100,
+                limit_per_host=8,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+                use_dns_cache=True,
+            ),
+            timeout=ClientTimeout(total=5),
+        )
 
         await self.load_all_cogs()
         return await super().start(*args, **kwargs)
@@ -93,27 +107,18 @@ class MathBot(commands.Bot):
         return await super().get_context(message, cls=cls)
 
     async def post_mystbin(self, code: str, *, language: Optional[str] = None) -> str:
-        MYSTBIN_URL = 'https://mystb.in/api/pastes'
-
-        payload = MultipartWriter()
-        content = payload.append(code)
-        content.set_content_disposition('form-data', name='data')
-
-        meta = {'index': 0}
-
-        if language:
-            meta['syntax'] = language
-
-        content = payload.append_json(
-            {'meta': [meta]}
-        )
+        MYSTBIN_URL = 'https://mystb.in/api/paste'
 
-        content.set_content_disposition("form-data", name='meta')
+        payload = {
+            'files': [
+                {'filename': f'file.{language or "txt"}', 'content': code},
+            ],
+        }
 
-        async with self.session.post(MYSTBIN_URL, data=payload) as r:
+        async with self.session.post(MYSTBIN_URL, json=payload) as r:
             if r.ok:
                 data = await r.json()
-                paste = 'https://mystb.in/' + data['pastes'][0]['id']
+                paste = 'https://mystb.in/' + data['id']
                 return paste
 
     async def on_command_error(self, ctx: MathContext, error: Exception) -> None:
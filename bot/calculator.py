@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import ClassVar
+from typing import Callable, ClassVar, Iterable, Iterator, TypeAlias
+import functools
+import operator
 import re
 
 import discord
@@ -8,50 +10,109 @@ import discord
 from .utils import *
 from .context import MathContext
 
-NUM_PAT = r'\d+\.?\d*'
+Token: TypeAlias = tuple[str, Number | str]
+
+_TOKEN_RE = re.compile(r'\s*(?:(\d+\.?\d*)|([+\-*/()]))')
+
+_SYMBOL_TABLE = str.maketrans({'×': '*', '÷': '/'})
+
+_PRECEDENCE: dict[str, int] = {'+': 1, '-': 1, '*': 2, '/': 2, 'neg': 3}
+
+_OPS: dict[str, Callable[[Number, Number], Number]] = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+}
+
+def _tokenize(expression: str) -> Iterator[Token]:
+    pos = 0
+    for match in _TOKEN_RE.finditer(expression):
+        if match.start() != pos:
+            raise InvalidEquation()
+        pos = match.end()
+
+        number, op = match.groups()
+        if number is not None:
+            yield ('num', num(number))
+        else:
+            yield ('op', op)
+
+    if expression[pos:].strip():
+        raise InvalidEquation()
+
+def shunting_yard(tokens: Iterable[Token]) -> list[Token]:
+    output: list[Token] = []
+    stack: list[str] = []
+    expect_operand = True
+
+    for kind, value in tokens:
+        if kind == 'num':
+            output.append((kind, value))
+            expect_operand = False
+        elif value == '(':
+            stack.append(value)
+        elif value == ')':
+            while stack and stack[-1] != '(':
+                output.append(('op', stack.pop()))
+            if not stack:
+                raise InvalidEquation()
+            stack.pop()
+            expect_operand = False
+        elif expect_operand:
+            # a sign in operand position is unary: `-` negates, `+` is a no-op
+            if value == '-':
+                stack.append('neg')
+            elif value != '+':
+                raise InvalidEquation()
+        else:
+            precedence = _PRECEDENCE[value]
+            while stack and stack[-1] != '(' and _PRECEDENCE[stack[-1]] >= precedence:
+                output.append(('op', stack.pop()))
+            stack.append(value)
+            expect_operand = True
+
+    while stack:
+        op = stack.pop()
+        if op == '(':
+            raise InvalidEquation()
+        output.append(('op', op))
+    return output
+
+def eval_rpn(rpn: Iterable[Token]) -> Number:
+    stack: list[Number] = []
+    try:
+        for kind, value in rpn:
+            if kind == 'num':
+                stack.append(value)
+            elif value == 'neg':
+                stack.append(-stack.pop())
+            else:
+                y = stack.pop()
+                x = stack.pop()
+                stack.append(_OPS[value](x, y))
+    except IndexError:
+        raise InvalidEquation() from None
+
+    if len(stack) != 1:
+        raise InvalidEquation()
+    return stack[0]
+
+@functools.lru_cache(maxsize=256)
+def _eval_expr(expression: str) -> str:
+    return str(eval_rpn(shunting_yard(_tokenize(expression))))
 
 class Calculator:
-    operators: ClassVar[tuple[str, ...]] = ("/", "*", "-", "+")
 
     def __init__(self, expression: str) -> None:
         self.expression = expression
 
     def __str__(self) -> str:
-        def recur(op) -> None:
-            self.sub_regex(op)
-            if re.search(fr"(-?{NUM_PAT}\{op}-?{NUM_PAT})", self.expression):
-                recur(op)
-
-        for op in self.operators:
-            if re.search(fr"(-?{NUM_PAT}\{op}-?{NUM_PAT})", self.expression):
-                recur(op)
-        return self.expression
-
-    def sub_regex(self, operator: str) -> None:
-        def sub_fn(v) -> str:
-            x, y = v.group().split(operator)
-            x, y = num(x), num(y)
-            conv = {
-                "/": lambda x, y: x/y,
-                "*": lambda x, y: x*y,
-                "-": lambda x, y: x-y,
-                "+": lambda x, y: x+y,
-            }
-            return str(conv.get(operator)(x, y))
-        try:
-            self.expression = re.sub(
-                fr"(-?{NUM_PAT}\{operator}-?{NUM_PAT})", sub_fn, self.expression
-            )
-        except TypeError:
-            pass
+        return _eval_expr(self.expression)
 
 class CalcButton(discord.ui.Button):
 
     view: CalculatorView
-    SYMBOL_CONV = {
-        '×': '*',
-        '÷': '/',
-    }
 
     def __init__(self, label: str, *, style: discord.ButtonStyle = discord.ButtonStyle.grey, row: int, custom_id: str = None):
         super().__init__(style=style, label=str(label), row=row, custom_id=custom_id)
@@ -59,15 +120,14 @@ class CalcButton(discord.ui.Button):
     async def edit(self, interaction: discord.Interaction, *, error: bool = False) -> discord.Message:
         content = 'ERROR' if error else self.view.expression
         content = content or '\u200b'
-        content += ' ' * (40 - len(content))
-        embed = discord.Embed(description=f'```ansi\n\u001b[0;32m{content}\n```', color=self.view.ctx.bot.color)
-        return await interaction.response.edit_message(embed=embed)
+        self.view.embed.description = f'```ansi\n\u001b[0;32m{content.ljust(40)}\n```'
+        return await interaction.response.edit_message(embed=self.view.embed)
 
     async def callback(self, interaction: discord.Interaction):
 
         if self.label == '=':
             try:
-                result = str(Calculator(self.view.expression))
+                result = _eval_expr(self.view.expression.translate(_SYMBOL_TABLE))
                 self.view.expression = result
                 return await self.edit(interaction)
             except Exception:
@@ -95,10 +155,17 @@ class CalcButton(discord.ui.Button):
             return await interaction.message.delete()
 
         else:
-            term = self.SYMBOL_CONV.get(self.label, self.label)
-            self.view.expression += term
+            self.view.expression += self.label
             return await self.edit(interaction)
 
+def _classify_style(label: int | str) -> discord.ButtonStyle:
+    return (
+        discord.ButtonStyle.green if label == '=' else
+        discord.ButtonStyle.blurple if label in ('+', '-', '×', '÷') else
+        discord.ButtonStyle.red if label in ('⌫', 'C', 'Close', 'ⓘ') else
+        discord.ButtonStyle.gray
+    )
+
 class CalculatorView(AuthorOnlyView):
 
     BUTTONS: ClassVar[tuple[tuple[int | str, ...], ...]] = (
@@ -107,6 +174,11 @@ class CalculatorView(AuthorOnlyView):
         (7, 8, 9, '×', 'Close'),
         ('.', '0', '=', '÷', 'ⓘ'),
     )
+    _FLAT_BUTTONS: ClassVar[tuple[tuple[str, discord.ButtonStyle, int], ...]] = tuple(
+        (str(label), _classify_style(label), i)
+        for i, row in enumerate(BUTTONS)
+        for label in row
+    )
 
     def __init__(
         self,
@@ -119,18 +191,7 @@ class CalculatorView(AuthorOnlyView):
 
         self.ctx = ctx
         self.expression: str = ''
+        self.embed = discord.Embed(color=ctx.bot.color)
 
-        for i, row in enumerate(self.BUTTONS):
-            for button in row:
-                style = (
-                    discord.ButtonStyle.green if button == '=' else
-                    discord.ButtonStyle.blurple if button in ('+', '-', '×', '÷') else
-                    discord.ButtonStyle.red if button in ('⌫', 'C', 'Close', 'ⓘ') else
-                    discord.ButtonStyle.gray
-                )
-
-                item = CalcButton(button, style=style, row=i)
-                if button == '\u200b':
-                    item.disabled = True
-
-                self.add_item(item)
\ No newline at end of file
+        for label, style, row in self._FLAT_BUTTONS:
+            self.add_item(CalcButton(label, style=style, row=row))
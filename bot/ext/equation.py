@@ -4,6 +4,9 @@ from typing import Optional
 
 from io import BytesIO
 from enum import Enum
+from dataclasses import dataclass, field
+import asyncio
+import functools
 import re
 import math
 import cmath
@@ -11,19 +14,40 @@ import cmath
 import discord
 from discord.ext import commands
 
-import aiohttp
 import numpy as np
 
 import matplotlib
 matplotlib.use('agg')
-from matplotlib import pyplot as plt
+from matplotlib.figure import Figure
+
+from PIL import Image, ImageDraw, ImageFont
 
 from ..calculator import CalculatorView
 from ..utils import *
 from ..bot import MathBot
 from ..context import MathContext
 
-LATEX_URL = 'https://latex.codecogs.com/png.latex?%5Cdpi%7B300%7D%20%5Chuge%20'
+GRAPH_SIZE = (512, 384)
+GRAPH_MARGIN = 24
+
+_GRAPH_BACKGROUND = (238, 238, 238)
+_GRAPH_GRID = (210, 210, 210)
+_GRAPH_AXIS = (120, 120, 120)
+_GRAPH_TEXT = (85, 85, 85)
+_GRAPH_LINE = (52, 138, 189)
+_GRAPH_MARKERS = ((166, 6, 40), (122, 104, 166))
+_GRAPH_FONT = ImageFont.load_default()
+
+_UNIT_GRID = np.linspace(-1.0, 1.0, 256, dtype=np.float32)
+
+_LATEX_UNESCAPE = str.maketrans({'\ue000': r'\frac', '\ue001': r'\times'})
+
+BLANK_DISPLAY = f'```py\n\u200b{" " * 40}\u200b\n```'
+
+_LIN2_RE = re.compile(fr'({NUM_PAT})(=)({NUM_PAT})\*?(x)(\+|-)({NUM_PAT})')
+_LIN3_RE = re.compile(fr'({NUM_PAT})=x\*?\(({NUM_PAT})(\+|-)({NUM_PAT})\)/\(({NUM_PAT})(\+|-)({NUM_PAT})\)')
+_QUAD_RE = re.compile(fr'({NUM_PAT})=({NUM_PAT})x\^2(\+|-)({NUM_PAT})x(\+|-)({NUM_PAT})')
+_ABCD_RE = re.compile(fr'\(({NUM_PAT})(\+|-)({NUM_PAT})\*({NUM_PAT})\)/({NUM_PAT})')
 
 INSTRUCTIONS_2STEP = (
     '• Solves a **2** step linear equation\n'
@@ -47,132 +71,242 @@ INSTRUCTIONS_QUAD = (
 
 END = '• Press each blue button to input the desired values for each variable in the equation\n'
 
+_BLURPLE_LABELS = frozenset({'+', '-', '÷', '×', '𝑥', '☐²', '(', ')'})
+_RED_LABELS = frozenset({'⌫', 'C', 'Close', 'ⓘ'})
+
+def _classify_manual_style(label: str) -> discord.ButtonStyle:
+    return (
+        discord.ButtonStyle.green if label == 'Enter' else
+        discord.ButtonStyle.blurple if label in _BLURPLE_LABELS else
+        discord.ButtonStyle.red if label in _RED_LABELS else
+        discord.ButtonStyle.gray
+    )
+
+@dataclass(slots=True, frozen=True)
+class EtypeSpec:
+    name: str
+    latex: str
+    instructions: str
+    equation: str
+    vars: tuple[str, ...]
+    buttons: tuple[tuple[int | str, ...], ...]
+    button_specs: tuple[tuple[str, discord.ButtonStyle, int, bool], ...] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'button_specs', tuple(
+            (str(label), _classify_manual_style(str(label)), i, label == '\u200b')
+            for i, row in enumerate(self.buttons)
+            for label in row
+        ))
+
 class Etype(Enum):
-    linear2 = {
-        'name': '2 Step Linear',
-        'latex': 'y=mx+b',
-        'instructions': INSTRUCTIONS_2STEP + END,
-        'equation': 'y = mx + b',
-        'vars': ('y', 'm', 'b'),
-        'buttons': (
+    linear2 = EtypeSpec(
+        name='2 Step Linear',
+        latex='y=mx+b',
+        instructions=INSTRUCTIONS_2STEP + END,
+        equation='y = mx + b',
+        vars=('y', 'm', 'b'),
+        buttons=(
             (1, 2, 3, '+', '⌫'),
             (4, 5, 6, '-', 'C'),
             (7, 8, 9, '𝑥', 'Close'),
             ('.', '0', '=', 'Enter', 'ⓘ'),
         )
-    }
-    linear3 = {
-        'name': '3 Step Linear',
-        'latex': r'y=\frac{x(a+b)}{c+d}',
-        'instructions': INSTRUCTIONS_3STEP + END,
-        'equation': 'y = x(a + b) / (c + d)',
-        'vars': ('y', 'a', 'b', 'c', 'd'),
-        'buttons': (
+    )
+    linear3 = EtypeSpec(
+        name='3 Step Linear',
+        latex=r'y=\frac{x(a+b)}{c+d}',
+        instructions=INSTRUCTIONS_3STEP + END,
+        equation='y = x(a + b) / (c + d)',
+        vars=('y', 'a', 'b', 'c', 'd'),
+        buttons=(
             (1, 2, 3, '+', '𝑥'),
             (4, 5, 6, '-', '('),
             (7, 8, 9, '÷', ')'),
             ('.', '0', '=', '\u200b', '\u200b'),
             ('Enter', '⌫', 'C', 'Close', 'ⓘ'),
         )
-    }
-    abcdformula = {
-        'name': '`(a + b * c) / d`',
-        'latex': r'\frac{a+b\times%20c}{d}',
-        'instructions': INSTRUCTIONS_ABCD + END,
-        'equation': '(a + b * c) / d',
-        'vars': ('a', 'b', 'c', 'd'),
-        'buttons': (
+    )
+    abcdformula = EtypeSpec(
+        name='`(a + b * c) / d`',
+        latex=r'\frac{a+b\times c}{d}',
+        instructions=INSTRUCTIONS_ABCD + END,
+        equation='(a + b * c) / d',
+        vars=('a', 'b', 'c', 'd'),
+        buttons=(
             (1, 2, 3, '+', '𝑥'),
             (4, 5, 6, '-', '('),
             (7, 8, 9, '×', ')'),
             ('.', '0', '=', '÷', '\u200b'),
             ('Enter', '⌫', 'C', 'Close', 'ⓘ'),
         )
-    }
-    quadratic = {
-        'name': 'Quadratic',
-        'latex': 'y=ax^2+bx+c',
-        'instructions': INSTRUCTIONS_QUAD + END,
-        'equation': 'ax^2 + bx + c',
-        'vars': ('y', 'a', 'b', 'c'),
-        'buttons': (
+    )
+    quadratic = EtypeSpec(
+        name='Quadratic',
+        latex='y=ax^2+bx+c',
+        instructions=INSTRUCTIONS_QUAD + END,
+        equation='ax^2 + bx + c',
+        vars=('y', 'a', 'b', 'c'),
+        buttons=(
             (1, 2, 3, '+', '⌫'),
             (4, 5, 6, '-', 'C'),
             (7, 8, 9, '𝑥', 'Close'),
             ('.', '0', '=', '☐²', 'Enter'),
             ('ⓘ', '\u200b', '\u200b', '\u200b', '\u200b')
         )
-    }
+    )
 
 def em_from_etype(etype: Etype, color: int | discord.Color = None) -> discord.Embed:
     embed = discord.Embed(
-        title=f"{etype.value['name']} Equation Solver",
-        description=etype.value['instructions'],
+        title=f"{etype.value.name} Equation Solver",
+        description=etype.value.instructions,
         color=color
     )
     return embed
 
-async def render_latex(session: aiohttp.ClientSession, latex: str) -> discord.File:
-    url = LATEX_URL + r'{\color{white}' + latex + r'}'
-    try:
-        async with session.get(url) as r:
-            buffer = BytesIO(await r.read())
-            return discord.File(buffer, 'equation.png')
-    except RecursionError as e:
-        raise e
-    except Exception:
-        return await render_latex(session, latex)
-
 @to_thread
-def plot_graph(*, etype: Etype, **variables: dict[str, Number]) -> BytesIO:
+@functools.lru_cache(maxsize=256)
+def render_latex(latex: str) -> bytes:
+    fig = Figure(figsize=(4, 1))
+    fig.text(0.5, 0.5, f'${latex}$', color='white', fontsize=32, ha='center', va='center')
 
-    plt.style.use(["fast", "fivethirtyeight", "ggplot"])
-    plt.style.use("bmh")
+    buffer = BytesIO()
+    fig.savefig(buffer, format='png', transparent=True, bbox_inches='tight', dpi=200)
+    return buffer.getvalue()
+
+def _tick_values(low: float, high: float, count: int = 6) -> np.ndarray:
+    raw_step = (high - low) / count
+    magnitude = 10 ** math.floor(math.log10(raw_step))
+    step = next(
+        mult * magnitude for mult in (1, 2, 5, 10) if raw_step <= mult * magnitude
+    )
+    return np.arange(math.ceil(low / step), math.floor(high / step) + 1) * step
+
+@to_thread_kw
+def plot_graph(*, etype: Etype, **variables: dict[str, Number]) -> BytesIO:
     buffer = BytesIO()
 
     x = variables.get('x')
     y = variables.get('y')
 
-    if isinstance(x, tuple):
-        lim = abs(x[-1]) * 3
-    else:
-        lim = abs(x) * 3
-
-    x_ = np.linspace(-lim, lim, 100)
+    roots = x if isinstance(x, tuple) else (x,)
+    lim = abs(roots[-1]) * 3 or 1
 
     if etype in (Etype.linear2, Etype.linear3):
         m = variables.get('m')
         b = variables.get('b')
-        y_  = [(m * i + b) for i in x_]
+        x_ = np.array([-lim, lim], dtype=np.float64)
+        y_ = m * x_ + b
     elif etype == Etype.quadratic:
+        x_ = _UNIT_GRID * lim
         a = variables.get('a')
         b = variables.get('b')
         c = variables.get('c')
-        y_  = [(a * i ** 2 + b * i + c) for i in x_]
-
-    fig = plt.figure()
-    ax = fig.add_subplot(1, 1, 1)
-    ax.spines['left'].set_position('center')
-    ax.spines['bottom'].set_position('zero')
-    ax.spines['right'].set_color('none')
-    ax.spines['top'].set_color('none')
-    ax.xaxis.set_ticks_position('bottom')
-    ax.yaxis.set_ticks_position('left')
-
-    plt.plot(x_, y_)
-
-    if isinstance(x, tuple):
-        for root in x:
-            plt.plot(root, y, marker='o')
-    else:
-        plt.plot(x, y, marker='o')
+        y_ = (a * x_ + b) * x_ + c
+
+    y_min = min(y_.min(), y, 0)
+    y_max = max(y_.max(), y, 0)
+    if y_min == y_max:
+        y_min, y_max = y_min - 1, y_max + 1
+
+    width, height = GRAPH_SIZE
+    x_scale = (width - 2 * GRAPH_MARGIN) / (2 * lim)
+    y_scale = (height - 2 * GRAPH_MARGIN) / (y_max - y_min)
+
+    def to_px(px: np.ndarray | float) -> np.ndarray | float:
+        return GRAPH_MARGIN + (px + lim) * x_scale
+
+    def to_py(py: np.ndarray | float) -> np.ndarray | float:
+        return height - GRAPH_MARGIN - (py - y_min) * y_scale
+
+    img = Image.new('RGB', GRAPH_SIZE, _GRAPH_BACKGROUND)
+    draw = ImageDraw.Draw(img)
+    font = _GRAPH_FONT
+
+    origin_x, origin_y = to_px(0), to_py(0)
+
+    for tick in _tick_values(-lim, lim):
+        px = to_px(tick)
+        draw.line([(px, GRAPH_MARGIN), (px, height - GRAPH_MARGIN)], fill=_GRAPH_GRID)
+        if tick:
+            left, top, right, bottom = draw.textbbox((0, 0), f'{tick:g}', font=font)
+            draw.text((px - (right - left) / 2, origin_y + 4), f'{tick:g}', fill=_GRAPH_TEXT, font=font)
+
+    for tick in _tick_values(y_min, y_max):
+        py = to_py(tick)
+        draw.line([(GRAPH_MARGIN, py), (width - GRAPH_MARGIN, py)], fill=_GRAPH_GRID)
+        if tick:
+            left, top, right, bottom = draw.textbbox((0, 0), f'{tick:g}', font=font)
+            draw.text((origin_x + 4, py - (bottom - top) / 2), f'{tick:g}', fill=_GRAPH_TEXT, font=font)
 
-    plt.savefig(buffer)
-    plt.close()
+    draw.line([(GRAPH_MARGIN, origin_y), (width - GRAPH_MARGIN, origin_y)], fill=_GRAPH_AXIS)
+    draw.line([(origin_x, GRAPH_MARGIN), (origin_x, height - GRAPH_MARGIN)], fill=_GRAPH_AXIS)
 
+    points = list(zip(to_px(x_).tolist(), to_py(y_).tolist()))
+    draw.line(points, fill=_GRAPH_LINE, width=2, joint='curve')
+
+    for root, color in zip(roots, _GRAPH_MARKERS):
+        px, py = to_px(root), to_py(y)
+        draw.ellipse([(px - 5, py - 5), (px + 5, py + 5)], fill=color)
+
+    img.save(buffer, 'PNG', compress_level=1)
     buffer.seek(0)
     return buffer
 
+_QUAD_STEPS = (
+    '{lhs}\n'
+    '0 = {a}𝑥² + {b}𝑥 + {cy}\n'
+    '𝑥 = ({nb} ± √({b}² - 4 * {a} * {cy})) / (2 * {a})\n'
+    '𝑥 = ({nb} ± √{b24ac}) / {a2}\n'
+)
+
+_QUAD_STEPS_ONE_ROOT = _QUAD_STEPS + (
+    '𝑥 = {nb} / {a2}\n'
+    '𝑥 = {root}'
+)
+
+_QUAD_STEPS_TWO_ROOTS = _QUAD_STEPS + (
+    '𝑥 = ({nb} ± {sqrtv}) / {a2}\n'
+    'Positive root:\n'
+    '𝑥 = ({nb} + {sqrtv}) / {a2}\n'
+    '𝑥 = {bplus} / {a2}\n'
+    '𝑥 = {root1}\n'
+    'Negative root:\n'
+    '𝑥 = ({nb} - {sqrtv}) / {a2}\n'
+    '𝑥 = {bminus} / {a2}\n'
+    '𝑥 = {root2}'
+)
+
+def _solve_linear2(m: Number, b: Number, y: Number) -> tuple[Number, Number]:
+    mx = y - b
+    return mx, mx / m
+
+def _solve_linear3(a: Number, b: Number, c: Number, d: Number, y: Number) -> tuple[Number, Number, Number, Number]:
+    ab = a + b
+    cd = c + d
+    xab = y * cd
+    return ab, cd, xab, xab / ab
+
+def _solve_quadratic(
+    a: Number, b: Number, c: Number, y: Number
+) -> tuple[Number, Number, Number, Number | complex, tuple[Number | complex, ...]]:
+    nb = -b
+    cy = c - y
+    a2 = a + a
+    b24ac = b * b - 4 * a * cy
+    sqrtv = cmath.sqrt(b24ac) if b24ac < 0 else math.sqrt(b24ac)
+
+    if b24ac == 0:
+        roots = (nb / a2,)
+    else:
+        roots = ((nb + sqrtv) / a2, (nb - sqrtv) / a2)
+    return cy, a2, b24ac, sqrtv, roots
+
+def _solve_abcd(a: Number, b: Number, c: Number, d: Number) -> tuple[Number, Number, Number]:
+    bc = b * c
+    abc = a + bc
+    return bc, abc, abc / d
+
 class EquationSolver:
 
     def __init__(self, equation: str = None, *, etype: Etype, **variables: dict[str, Number]) -> None:
@@ -191,14 +325,12 @@ class EquationSolver:
 
         if self.etype == Etype.linear2:
 
-            if (
+            if not (
                 (m := self.variables.get('m')) is not None and
                 (b := self.variables.get('b')) is not None and
                 (y := self.variables.get('y')) is not None
             ):
-                m, b, y = num(m), num(b), num(y)
-            else:
-                if terms := re.match(fr'({NUM_PAT})(=)({NUM_PAT})\*?(x)(\+|-)({NUM_PAT})', self.equation):
+                if terms := _LIN2_RE.fullmatch(self.equation):
                     y = num(terms.group(1))
                     m = num(terms.group(3))
                     op = terms.group(5)
@@ -207,19 +339,18 @@ class EquationSolver:
                 else:
                     raise InvalidEquation()
 
-            mx = y - b
-            x = mx / m
+            mx, x = _solve_linear2(m, b, y)
 
-            steps = (
-                f'{self.equation or f"{y} = {m}𝑥 + {b}"}\n'+
+            steps = '\n'.join((
+                self.equation or f'{y} = {m}𝑥 + {b}',
                 (
-                    f'{m}𝑥 = {y} - {b}\n' if b > 0 else
-                    f'{m}𝑥 = {y} + {abs(b)}\n' if b < 0 else
-                    f'{m}𝑥 = {y}\n'
-                ) +
-                f'𝑥 = {mx} / {m}\n'+
-                f'𝑥 = {x}'
-            )
+                    f'{m}𝑥 = {y} - {b}' if b > 0 else
+                    f'{m}𝑥 = {y} + {abs(b)}' if b < 0 else
+                    f'{m}𝑥 = {y}'
+                ),
+                f'𝑥 = {mx} / {m}',
+                f'𝑥 = {x}',
+            ))
             return {
                 'm': m,
                 'b': b,
@@ -230,16 +361,14 @@ class EquationSolver:
 
         elif self.etype == Etype.linear3:
 
-            if (
+            if not (
                 (a := self.variables.get('a')) is not None and
                 (b := self.variables.get('b')) is not None and
                 (c := self.variables.get('c')) is not None and
                 (d := self.variables.get('d')) is not None and
                 (y := self.variables.get('y')) is not None
             ):
-                a, b, c, d, y = num(a), num(b), num(c), num(d), num(y)
-            else:
-                if terms := re.match(fr'({NUM_PAT})=x\*?\(({NUM_PAT})(\+|-)({NUM_PAT})\)/\(({NUM_PAT})(\+|-)({NUM_PAT})', self.equation):
+                if terms := _LIN3_RE.fullmatch(self.equation):
 
                     y = num(terms.group(1))
 
@@ -255,19 +384,16 @@ class EquationSolver:
                 else:
                     raise InvalidEquation()
 
-            ab =  a + b
-            cd = c + d
-            xab = y * cd
-            x = xab / ab
-
-            steps = (
-               f'{self.equation or f"{y} = 𝑥({a} + {b}) / ({c} + {d})"}\n'+
-               f'{y} = {ab}𝑥 / ({cd})\n'+
-               f'{ab}𝑥 = {y} * {cd}\n'+
-               f'{ab}𝑥 = {xab}\n'+
-               f'𝑥 = {xab} / {ab}\n'+
-               f'𝑥 = {x}\n'
-            )
+            ab, cd, xab, x = _solve_linear3(a, b, c, d, y)
+
+            steps = '\n'.join((
+                self.equation or f'{y} = 𝑥({a} + {b}) / ({c} + {d})',
+                f'{y} = {ab}𝑥 / ({cd})',
+                f'{ab}𝑥 = {y} * {cd}',
+                f'{ab}𝑥 = {xab}',
+                f'𝑥 = {xab} / {ab}',
+                f'𝑥 = {x}',
+            ))
             return {
                 'm': ab,
                 'b': 0,
@@ -278,15 +404,13 @@ class EquationSolver:
 
         elif self.etype == Etype.quadratic:
 
-            if (
+            if not (
                 (a := self.variables.get('a')) is not None and
                 (b := self.variables.get('b')) is not None and
                 (c := self.variables.get('c')) is not None and
                 (y := self.variables.get('y')) is not None
             ):
-                a, b, c, y = num(a), num(b), num(c), num(y)
-            else:
-                if terms := re.match(fr'({NUM_PAT})=({NUM_PAT})x\^2(\+|-)({NUM_PAT})x(\+|-)({NUM_PAT})', self.equation):
+                if terms := _QUAD_RE.fullmatch(self.equation):
                     y = num(terms.group(1))
 
                     a = num(terms.group(2))
@@ -300,48 +424,22 @@ class EquationSolver:
                 else:
                     raise InvalidEquation()
 
-            cy = c - y
-            a2 = 2 * a
-            b24ac = b ** 2 - 4 * a * cy
+            cy, a2, b24ac, sqrtv, roots = _solve_quadratic(a, b, c, y)
+            nb = -b
 
-            try:
-                sqrtv = math.sqrt(b24ac)
-            except ValueError:
-                sqrtv = cmath.sqrt(b24ac)
-
-            if b24ac == 0:
-                roots = (-b / a2,)
-            else:
-                bplus = -b + sqrtv
-                roots1 = bplus / a2
-
-                bminus = -b - sqrtv
-                roots2 = bminus / a2
-                roots = (roots1, roots2)
-
-            steps = (
-                f'{self.equation or f"{y} = {a}𝑥² + {b}𝑥 + {c}"}\n'
-                f'0 = {a}𝑥² + {b}𝑥 + {cy}\n'
-                f'𝑥 = ({-b} ± √({b}² - 4 * {a} * {c})) / (2 * {a})\n'
-                f'𝑥 = ({-b} ± √{b24ac}) / {a2}\n'
-            )
+            values = {
+                'lhs': self.equation or f'{y} = {a}𝑥² + {b}𝑥 + {c}',
+                'a': a, 'b': b, 'cy': cy, 'nb': nb,
+                'a2': a2, 'b24ac': b24ac, 'sqrtv': sqrtv,
+            }
 
             if b24ac == 0:
-                steps += (
-                    f'𝑥 = {-b} / {a2}'
-                    f'𝑥 = {roots[0]}'
-                )
+                steps = _QUAD_STEPS_ONE_ROOT.format(root=roots[0], **values)
             else:
-                steps += (
-                    f'𝑥 = ({-b} ± {sqrtv}) / {a2}\n'
-                    'Positive root:\n'
-                    f'𝑥 = ({-b} + {sqrtv}) / {a2}\n'
-                    f'𝑥 = {bplus} / {a2}\n'
-                    f'𝑥 = {roots1}\n'
-                    'Negative root:\n'
-                    f'𝑥 = ({-b} - {sqrtv}) / {a2}\n'
-                    f'𝑥 = {bminus} / {a2}\n'
-                    f'𝑥 = {roots2}\n'
+                steps = _QUAD_STEPS_TWO_ROOTS.format(
+                    bplus=nb + sqrtv, bminus=nb - sqrtv,
+                    root1=roots[0], root2=roots[1],
+                    **values,
                 )
             return {
                 'a': a,
@@ -350,19 +448,18 @@ class EquationSolver:
                 'x': roots,
                 'y': y,
                 'steps': steps,
+                'complex': isinstance(sqrtv, complex),
             }
 
         elif self.etype == Etype.abcdformula:
 
-            if (
+            if not (
                 (a := self.variables.get('a')) is not None and
                 (b := self.variables.get('b')) is not None and
                 (c := self.variables.get('c')) is not None and
                 (d := self.variables.get('d')) is not None
             ):
-                a, b, c, d = num(a), num(b), num(c), num(d)
-            else:
-                if terms := re.match(fr'\(({NUM_PAT})(\+|-)({NUM_PAT})\*({NUM_PAT})\)/({NUM_PAT})', self.equation):
+                if terms := _ABCD_RE.fullmatch(self.equation):
                     a = num(terms.group(1))
 
                     op = terms.group(2)
@@ -374,27 +471,63 @@ class EquationSolver:
                 else:
                     raise InvalidEquation()
 
-            bc = b * c
-            abc = a + bc
-            abcd = abc / d
+            bc, abc, abcd = _solve_abcd(a, b, c, d)
 
-            steps = (
-                f'= {self.equation or f"({a} + {b} × {c}) / {d}"}\n'
-                f'= {a} + {bc}\n'
-                f'= {abc} / {d}\n'
-                f'= {abcd}\n'
-            )
+            steps = '\n'.join((
+                f'= {self.equation or f"({a} + {b} × {c}) / {d}"}',
+                f'= {a} + {bc}',
+                f'= {abc} / {d}',
+                f'= {abcd}',
+            ))
             return steps
 
+async def send_solution(interaction: discord.Interaction, solver: EquationSolver, *, color: int) -> None:
+    if solver.etype == Etype.abcdformula:
+        steps = solver.evaluate()
+        assert isinstance(steps, str)
+
+        embed = discord.Embed(
+            title='Solution:',
+            description=f'```py\n{steps}\n```',
+            color=color
+        )
+
+        return await interaction.response.edit_message(embed=embed, attachments=[], view=None)
+
+    results = solver.evaluate()
+    steps = results.pop('steps')
+
+    if results.pop('complex', False):
+        embed = discord.Embed(
+            title='Solution: No real roots',
+            description=f'```py\n{steps}\n```',
+            color=color
+        )
+        return await interaction.response.edit_message(embed=embed, attachments=[], view=None)
+
+    graph_task = asyncio.create_task(plot_graph(**results, etype=solver.etype))
+
+    embed = discord.Embed(
+        title='Solution:',
+        description=f'```py\n{steps}\n```',
+        color=color
+    )
+    embed.set_image(url='attachment://graph.png')
+
+    graph = discord.File(await graph_task, 'graph.png')
+    return await interaction.response.edit_message(embed=embed, attachments=[graph], view=None)
+
 class ManualButton(discord.ui.Button):
 
     view: ManualModeView
-    SYMBOL_CONV = {
+    # '☐²' is two characters: drop the box and expand the superscript
+    SYMBOL_TABLE = str.maketrans({
         '𝑥': 'x',
         '×': '*',
         '÷': '/',
-        '☐²': '^2'
-    }
+        '☐': None,
+        '²': '^2',
+    })
 
     def __init__(self, label: str, *, style: discord.ButtonStyle = discord.ButtonStyle.grey, row: int):
         super().__init__(style=style, label=str(label), row=row)
@@ -402,39 +535,15 @@ class ManualButton(discord.ui.Button):
     async def edit(self, interaction: discord.Interaction, *, error: bool = False) -> discord.Message:
         content = 'Invalid Equation' if error else self.view.equation
         content = content or '\u200b'
-        content += ' ' * (40 - len(content))
-        embed = discord.Embed(description=f'```ansi\n\u001b[0;32m{content}\n```', color=self.view.ctx.bot.color)
-        return await interaction.response.edit_message(embed=embed)
+        self.view.embed.description = f'```ansi\n\u001b[0;32m{content.ljust(40)}\n```'
+        return await interaction.response.edit_message(embed=self.view.embed)
 
     async def callback(self, interaction: discord.Interaction) -> discord.Message:
 
         if self.label == 'Enter':
             try:
-                if self.view.etype == Etype.abcdformula:
-                    steps = EquationSolver(self.view.equation, etype=self.view.etype).evaluate()
-                    assert isinstance(steps, str)
-
-                    embed = discord.Embed(
-                        title='Solution:',
-                        description=f'```py\n{steps}\n```',
-                        color=self.view.ctx.bot.color
-                    )
-
-                    return await interaction.response.edit_message(embed=embed, attachments=[], view=None)
-                else:
-                    results = EquationSolver(self.view.equation, etype=self.view.etype).evaluate()
-                    steps = results.pop('steps')
-                    graph = await plot_graph(**results, etype=self.view.etype)
-                    graph = discord.File(graph, 'graph.png')
-
-                    embed = discord.Embed(
-                        title='Solution:',
-                        description=f'```py\n{steps}\n```',
-                        color=self.view.ctx.bot.color
-                    )
-                    embed.set_image(url='attachment://graph.png')
-
-                    return await interaction.response.edit_message(embed=embed, attachments=[graph], view=None)
+                solver = EquationSolver(self.view.equation, etype=self.view.etype)
+                return await send_solution(interaction, solver, color=self.view.ctx.bot.color)
             except InvalidEquation:
                 return await self.edit(interaction, error=True)
             except Exception as e:
@@ -446,9 +555,9 @@ class ManualButton(discord.ui.Button):
             embed = discord.Embed(title='Equation Solver - Manual Mode', color=self.view.ctx.bot.color)
             embed.description = (
                 '• Equation Solver\n'
-                f"• Solves a {self.view.etype.value['name']} Equation\n"
+                f"• Solves a {self.view.etype.value.name} Equation\n"
                 '• Press the buttons to enter numbers and operators\n'
-                f"• Enter the equation in the format of `{self.view.etype.value['equation']}`\n"
+                f"• Enter the equation in the format of `{self.view.etype.value.equation}`\n"
                 '• Hit `Enter` to evaluate the entered expression\n'
             )
             return await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -465,8 +574,7 @@ class ManualButton(discord.ui.Button):
             return await interaction.message.delete()
 
         else:
-            term = self.SYMBOL_CONV.get(self.label, self.label)
-            self.view.equation += term
+            self.view.equation += self.label.translate(self.SYMBOL_TABLE)
             return await self.edit(interaction)
 
 class ManualModeView(AuthorOnlyView):
@@ -485,23 +593,13 @@ class ManualModeView(AuthorOnlyView):
         self.ctx = ctx
         self.etype = etype
         self.equation: str = ''
-        self.buttons = etype.value['buttons']
-
-        for i, row in enumerate(self.buttons):
-            for button in row:
-                style = (
-                    discord.ButtonStyle.green if button == 'Enter' else
-                    discord.ButtonStyle.blurple if button in ('+', '-', '÷', '×', '𝑥', '☐²', '(', ')') else
-                    discord.ButtonStyle.red if button in ('⌫', 'C', 'Close', 'ⓘ') else
-                    discord.ButtonStyle.gray
-                )
-
-                item = ManualButton(button, style=style, row=i)
-
-                if button == '\u200b':
-                    item.disabled = True
+        self.embed = discord.Embed(color=ctx.bot.color)
+        self.buttons = etype.value.buttons
 
-                self.add_item(item)
+        for label, style, row, disabled in etype.value.button_specs:
+            item = ManualButton(label, style=style, row=row)
+            item.disabled = disabled
+            self.add_item(item)
 
 class VarInput(discord.ui.Modal, title='Variable Input'):
 
@@ -521,33 +619,30 @@ class VarInput(discord.ui.Modal, title='Variable Input'):
     async def on_submit(self, interaction: discord.Interaction) -> None:
         value = self.value.value
         try:
-            float(value)
+            n = float(value)
         except ValueError:
             return await interaction.response.send_message('Value must be a number!, try again', ephemeral=True)
         else:
-            self.button.value = num(value)
-            self.button.view.equation_vars[self.button.label] = value
+            n = int(n) if n.is_integer() else n
+            self.button.value = n
+            self.button.view.equation_vars[self.button.label] = n
 
             etype = self.button.view.etype
 
             embed = em_from_etype(etype, color=self.button.view.ctx.bot.color)
 
-            remove_latex = self.button.view.latex_eq.replace(r'\frac', '\u0000')
-            remove_latex = remove_latex.replace(r'\times', '\u0001')
-
-            remove_latex = remove_latex.replace(self.variable, value)
-
-            replace_latex = remove_latex.replace('\u0000', r'\frac')
-            self.button.view.latex_eq = replace_latex.replace('\u0001', r'\times')
+            view = self.button.view
+            view.latex_template = view.latex_template.replace(self.variable, value)
+            view.latex_eq = view.latex_template.translate(_LATEX_UNESCAPE)
 
-            img = await render_latex(self.button.view.ctx.bot.session, self.button.view.latex_eq)
+            img = discord.File(BytesIO(await render_latex(view.latex_eq)), 'equation.png')
             embed.set_image(url='attachment://equation.png')
 
             self.button.disabled = True
 
-            first_row = (button for button in self.button.view.children if button.row in (0, None))
-            if all(child.disabled for child in first_row):
-                self.button.view.children[-1].disabled = False
+            view.remaining_vars -= 1
+            if view.remaining_vars == 0:
+                view.enter_button.disabled = False
 
             return await interaction.response.edit_message(embed=embed, attachments=[img], view=self.button.view)
 
@@ -565,32 +660,8 @@ class VarButton(discord.ui.Button):
             return await interaction.message.delete()
         elif self.label == 'Enter':
             try:
-                if self.view.etype == Etype.abcdformula:
-                    steps = EquationSolver(etype=self.view.etype, **self.view.equation_vars).evaluate()
-                    assert isinstance(steps, str)
-
-                    embed = discord.Embed(
-                        title='Solution:',
-                        description=f'```py\n{steps}\n```',
-                        color=self.view.ctx.bot.color
-                    )
-
-                    return await interaction.response.edit_message(embed=embed, attachments=[], view=None)
-
-                else:
-                    results = EquationSolver(etype=self.view.etype, **self.view.equation_vars).evaluate()
-                    steps = results.pop('steps')
-                    graph = await plot_graph(**results, etype=self.view.etype)
-                    graph = discord.File(graph, 'graph.png')
-
-                    embed = discord.Embed(
-                        title='Solution:',
-                        description=f'```py\n{steps}\n```',
-                        color=self.view.ctx.bot.color
-                    )
-                    embed.set_image(url='attachment://graph.png')
-
-                    return await interaction.response.edit_message(embed=embed, attachments=[graph], view=None)
+                solver = EquationSolver(etype=self.view.etype, **self.view.equation_vars)
+                return await send_solution(interaction, solver, color=self.view.ctx.bot.color)
             except ZeroDivisionError:
                 return await interaction.response.send_message('Division by 0 is not allowed. try again', ephemeral=True)
             except Exception as e:
@@ -600,8 +671,7 @@ class VarButton(discord.ui.Button):
 
         elif self.label == 'manual mode':
             ctx = self.view.ctx
-            spaces = ' ' * 40
-            embed = discord.Embed(description=f'```py\n\u200b{spaces}\u200b\n```', color=self.view.ctx.bot.color)
+            embed = discord.Embed(description=BLANK_DISPLAY, color=self.view.ctx.bot.color)
             return await interaction.response.edit_message(
                 embed=embed,
                 attachments=[],
@@ -626,17 +696,20 @@ class EquationView(AuthorOnlyView):
         self.etype = etype
 
         self.equation_vars: dict[str, Number] = {}
-        self.latex_eq: str = etype.value['latex']
+        self.latex_eq: str = etype.value.latex
+        self.latex_template: str = self.latex_eq.replace(r'\frac', '\ue000').replace(r'\times', '\ue001')
+
+        self.remaining_vars: int = len(etype.value.vars)
 
-        for var in self.etype.value['vars']:
+        for var in self.etype.value.vars:
             self.add_item(VarButton(var))
 
         self.add_item(VarButton('Cancel', style=discord.ButtonStyle.red, row=1))
         self.add_item(VarButton('manual mode', style=discord.ButtonStyle.red, row=1))
 
-        enter = VarButton('Enter', style=discord.ButtonStyle.green, row=1)
-        enter.disabled = True
-        self.add_item(enter)
+        self.enter_button = VarButton('Enter', style=discord.ButtonStyle.green, row=1)
+        self.enter_button.disabled = True
+        self.add_item(self.enter_button)
 
 class EquationSelect(discord.ui.Select):
 
@@ -664,17 +737,16 @@ class EquationSelect(discord.ui.Select):
     async def callback(self, interaction: discord.Interaction) -> None:
         value = self.values[0]
         if value == 'CALCULATOR':
-            spaces = ' ' * 40
             return await interaction.response.edit_message(
-                embed=discord.Embed(description=f'```py\n\u200b{spaces}\u200b\n```', color=self.bot.color),
+                embed=discord.Embed(description=BLANK_DISPLAY, color=self.bot.color),
                 view=CalculatorView(self.view.ctx, self.view.ctx.author, timeout=300)
             )
 
         etype = Etype[value]
 
-        equation = etype.value['latex']
+        equation = etype.value.latex
         embed = em_from_etype(etype, self.view.ctx.bot.color)
-        img = await render_latex(self.bot.session, equation)
+        img = discord.File(BytesIO(await render_latex(equation)), 'equation.png')
         embed.set_image(url='attachment://equation.png')
 
         view = EquationView(self.view.ctx, self.view.author, etype=etype, timeout=300)
@@ -1,6 +1,11 @@
-from typing import Awaitable, Optional, Callable, TypeVar, ParamSpec, TypeAlias
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, TypeAlias
 import functools
 import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+import re
 
 import discord
 
@@ -8,50 +13,88 @@ __all__: tuple[str, ...] = (
     'InvalidEquation',
     'Number',
     'NUM_PAT',
+    'NUM_RE',
     'num',
     'to_thread',
+    'to_thread_kw',
     'truncate',
     'AuthorOnlyView',
 )
 
-P = ParamSpec('P')
-T = TypeVar('T')
+if TYPE_CHECKING:
+    from typing import Any, Awaitable, Callable, TypeVar, ParamSpec
+
+    P = ParamSpec('P')
+    T = TypeVar('T')
 
 Number: TypeAlias = int | float
-NUM_PAT = r'[-+]?\d+\.?\d*'
+NUM_PAT = r'[-+]?\d+(?:\.\d+)?'
+NUM_RE: re.Pattern[str] = re.compile(NUM_PAT)
+
+EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='to_thread')
 
 class InvalidEquation(Exception):
     pass
 
+@functools.lru_cache(maxsize=1024)
 def num(n: str) -> Number:
-    n = float(n)
-    if n.is_integer():
-        n = int(n)
-    return n
+    if n.lstrip('+-').isdecimal():
+        return int(n)
+    f = float(n)
+    return int(f) if f.is_integer() else f
+
+def _copy_metadata(wrapper: Callable[..., Any], func: Callable[..., Any]) -> None:
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func
 
 def to_thread(func: Callable[P, T]) -> Callable[P, Awaitable[T]]:
 
-    @functools.wraps(func)
-    def wrapper(*args: P.args, **kwargs: P.kwargs) -> Awaitable[T]:
-        return asyncio.to_thread(func, *args, **kwargs)
+    def wrapper(*args: P.args) -> Awaitable[T]:
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        if ctx:
+            return loop.run_in_executor(EXECUTOR, ctx.run, func, *args)
+        return loop.run_in_executor(EXECUTOR, func, *args)
+
+    _copy_metadata(wrapper, func)
+    return wrapper
+
+def to_thread_kw(func: Callable[P, T]) -> Callable[P, Awaitable[T]]:
+
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        return await loop.run_in_executor(EXECUTOR, ctx.run, functools.partial(func, *args, **kwargs))
 
+    _copy_metadata(wrapper, func)
     return wrapper
 
+_ELLIPSIS = '...'
+
 def truncate(content: str, limit: int = 2000) -> str:
     if len(content) > limit:
-        return content[:1997] + '...'
+        return content[:limit - len(_ELLIPSIS)] + _ELLIPSIS
     else:
         return content
 
+_REJECT_TASKS: set[asyncio.Task[None]] = set()
+
 class AuthorOnlyView(discord.ui.View):
+    __slots__ = ('author', '_author_id', '_reject_msg')
 
     def __init__(self, author: discord.User, *, timeout: Optional[float] = None):
-        super().__init__(timeout=timeout)
         self.author = author
+        self._author_id: int = author.id
+        self._reject_msg: str = f'This interaction can only be used by {author.mention}'
+        super().__init__(timeout=timeout)
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        if interaction.user != self.author:
-            await interaction.response.send_message(f'This interaction can only be used by {self.author.mention}', ephemeral=True)
+        if interaction.user.id != self._author_id:
+            task = asyncio.create_task(interaction.response.send_message(self._reject_msg, ephemeral=True))
+            _REJECT_TASKS.add(task)
+            task.add_done_callback(_REJECT_TASKS.discard)
             return False
         else:
             return True
\ No newline at end of file